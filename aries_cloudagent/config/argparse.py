@@ -1190,6 +1190,18 @@ class ProtocolGroup(ArgumentGroup):
             env_var="ACAPY_EXP_DIDCOMM_V2",
             help="Enable experimental DIDComm V2 support.",
         )
+        parser.add_argument(
+            "--max-did-rotates-in-flight",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_MAX_DID_ROTATES_IN_FLIGHT",
+            help=(
+                "Set the maximum number of received DID rotate messages that are "
+                "resolved and committed concurrently. The limit applies to the "
+                "whole process, shared by all tenant wallets. Additional rotates "
+                "wait for a slot. Default: 16."
+            ),
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Get protocol settings."""
@@ -1258,6 +1270,8 @@ class ProtocolGroup(ArgumentGroup):
             environ["EXCH_UNENCRYPTED_TAGS"] = "True"
         if args.experimental_didcomm_v2:
             settings["experiment.didcomm_v2"] = True
+        if args.max_did_rotates_in_flight:
+            settings["did_rotate.max_in_flight"] = args.max_did_rotates_in_flight
 
         return settings
 
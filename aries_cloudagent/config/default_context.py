@@ -10,6 +10,7 @@ from ..core.profile import ProfileManager, ProfileManagerProvider
 from ..core.protocol_registry import ProtocolRegistry
 from ..protocols.actionmenu.v1_0.base_service import BaseMenuService
 from ..protocols.actionmenu.v1_0.driver_service import DriverMenuService
+from ..protocols.did_rotate.v1_0.manager import DIDRotateClaims, DIDRotateLimiter
 from ..protocols.introduction.v0_1.base_service import BaseIntroductionService
 from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
 from ..resolver.did_resolver import DIDResolver
@@ -61,6 +62,16 @@ class DefaultContextBuilder(ContextBuilder):
             BaseVerificationKeyStrategy, DefaultVerificationKeyStrategy()
         )
 
+        # Process-wide bound on DID rotates processed concurrently
+        context.injector.bind_instance(
+            DIDRotateLimiter,
+            DIDRotateLimiter(
+                context.settings.get_int("did_rotate.max_in_flight")
+                or DIDRotateLimiter.DEFAULT_MAX_IN_FLIGHT
+            ),
+        )
+        context.injector.bind_instance(DIDRotateClaims, DIDRotateClaims())
+
         # DIDComm Messaging
         if context.settings.get("experiment.didcomm_v2"):
             from didcomm_messaging import (
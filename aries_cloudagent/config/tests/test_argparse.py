@@ -587,6 +587,28 @@ class TestArgParse(IsolatedAsyncioTestCase):
             "disclose_goal_code_list"
         )
 
+    async def test_did_rotate_args(self):
+        """Test DID rotate related argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        # ProtocolGroup settings also read the label from TransportGroup
+        argparse.TransportGroup().add_arguments(parser)
+        group = argparse.ProtocolGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args([])
+        settings = group.get_settings(result)
+        assert "did_rotate.max_in_flight" not in settings
+
+        result = parser.parse_args(["--max-did-rotates-in-flight", "4"])
+        assert result.max_did_rotates_in_flight == 4
+
+        settings = group.get_settings(result)
+        assert settings.get("did_rotate.max_in_flight") == 4
+
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--max-did-rotates-in-flight", "0"])
+
     def test_universal_resolver(self):
         """Test universal resolver flags."""
         parser = argparse.create_argument_parser()
@@ -4,6 +4,7 @@ from unittest import IsolatedAsyncioTestCase
 from ...cache.base import BaseCache
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
+from ...protocols.did_rotate.v1_0.manager import DIDRotateClaims, DIDRotateLimiter
 from ...transport.wire_format import BaseWireFormat
 from ..default_context import DefaultContextBuilder
 from ..injection_context import InjectionContext
@@ -20,6 +21,8 @@ class TestDefaultContext(IsolatedAsyncioTestCase):
         for cls in (
             BaseCache,
             BaseWireFormat,
+            DIDRotateClaims,
+            DIDRotateLimiter,
             ProfileManager,
             ProtocolRegistry,
         ):
@@ -432,18 +432,27 @@ class BaseConnectionManager:
             await storage.delete_all_records(self.RECORD_TYPE_DID_KEY, {"did": did})
 
     async def resolve_didcomm_services(
-        self, did: str, service_accept: Optional[Sequence[Text]] = None
+        self,
+        did: str,
+        service_accept: Optional[Sequence[Text]] = None,
+        *,
+        document: Optional[dict] = None,
     ) -> Tuple[ResolvedDocument, List[DIDCommService]]:
-        """Resolve a DIDComm services for a given DID."""
+        """Resolve a DIDComm services for a given DID.
+
+        If an already resolved DID document is passed in, it is used instead of
+        resolving the DID again.
+        """
         if not did.startswith("did:"):
             # DID is bare indy "nym"
             # prefix with did:sov: for backwards compatibility
             did = f"did:sov:{did}"
 
-        resolver = self._profile.inject(DIDResolver)
         try:
-            doc_dict: dict = await resolver.resolve(self._profile, did, service_accept)
-            doc: ResolvedDocument = pydid.deserialize_document(doc_dict, strict=True)
+            if document is None:
+                resolver = self._profile.inject(DIDResolver)
+                document = await resolver.resolve(self._profile, did, service_accept)
+            doc: ResolvedDocument = pydid.deserialize_document(document, strict=True)
         except ResolverError as error:
             raise BaseConnectionManagerError("Failed to resolve DID services") from error
 
@@ -518,12 +527,16 @@ class BaseConnectionManager:
             [self._extract_key_material_in_base58_format(key) for key in routing_keys],
         )
 
-    async def record_keys_for_resolvable_did(self, did: str):
+    async def record_keys_for_resolvable_did(
+        self, did: str, *, document: Optional[dict] = None
+    ):
         """Record the keys for a public DID.
 
         This is required to correlate sender verkeys back to a connection.
         """
-        doc, didcomm_services = await self.resolve_didcomm_services(did)
+        doc, didcomm_services = await self.resolve_didcomm_services(
+            did, document=document
+        )
         for service in didcomm_services:
             recips, _ = await self.verification_methods_for_service(doc, service)
             for recip in recips:
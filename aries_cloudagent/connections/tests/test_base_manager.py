@@ -1098,6 +1098,26 @@ class TestBaseConnectionManager(IsolatedAsyncioTestCase):
         )
         await self.manager.record_keys_for_resolvable_did(did)
 
+    async def test_resolve_didcomm_services_with_document(self):
+        did = "did:sov:" + self.test_did
+        doc_builder = DIDDocumentBuilder(did)
+        vm = doc_builder.verification_method.add(
+            Ed25519VerificationKey2018,
+            public_key_base58=self.test_verkey,
+        )
+        doc_builder.service.add_didcomm(
+            self.test_endpoint, recipient_keys=[vm], routing_keys=[]
+        )
+        doc = doc_builder.build()
+        self.resolver.resolve = mock.CoroutineMock()
+
+        resolved, services = await self.manager.resolve_didcomm_services(
+            did, document=doc.serialize()
+        )
+        self.resolver.resolve.assert_not_called()
+        assert resolved.id == doc.id
+        assert len(services) == 1
+
     async def test_diddoc_connection_targets_diddoc_underspecified(self):
         with self.assertRaises(BaseConnectionManagerError):
             self.manager.diddoc_connection_targets(None, self.test_verkey)
@@ -166,6 +166,9 @@ class AgentMessage(BaseModel, BaseMessage):
             version: The version to assign
 
         """
+        if version == self._version:
+            # Already at this version, skip re-parsing the message type
+            return
         self._message_type = self._message_type.with_version(version)
 
     @_decorators.setter
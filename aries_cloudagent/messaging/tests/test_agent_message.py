@@ -1,5 +1,5 @@
 from typing import Optional
-from unittest import IsolatedAsyncioTestCase
+from unittest import IsolatedAsyncioTestCase, mock
 
 from marshmallow import EXCLUDE, fields
 
@@ -9,6 +9,7 @@ from ...wallet.key_type import ED25519
 from ..agent_message import AgentMessage, AgentMessageSchema
 from ..decorators.signature_decorator import SignatureDecorator
 from ..decorators.trace_decorator import TRACE_LOG_TARGET, TraceReport
+from ..message_type import MessageTypeStr
 from ..models.base import BaseModelError
 
 
@@ -69,6 +70,19 @@ class TestAgentMessage(IsolatedAsyncioTestCase):
             BadImplementationClass()  # pylint: disable=E0110
         assert "Can't instantiate abstract" in str(context.exception)
 
+    def test_assign_version(self):
+        message = BasicAgentMessage(_version="1.0")
+        assert message._version == "1.0"
+
+        with mock.patch.object(MessageTypeStr, "with_version") as mock_with_version:
+            message.assign_version("1.0")
+            mock_with_version.assert_not_called()
+        assert message._version == "1.0"
+
+        message.assign_version("1.1")
+        assert message._version == "1.1"
+        assert message._type.endswith("/protocol/1.1/basic-message")
+
     async def test_field_signature(self):
         session = InMemoryProfile.test_session()
         wallet = session.wallet
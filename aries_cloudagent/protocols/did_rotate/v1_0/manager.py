@@ -3,6 +3,10 @@
 Manages and tracks the state of the DID Rotate protocol.
 """
 
+import asyncio
+from functools import cached_property
+from typing import Dict, Optional, Set, Tuple
+
 from ....connections.base_manager import (
     BaseConnectionManager,
     BaseConnectionManagerError,
@@ -44,6 +48,52 @@ class UnrecordableKeysError(ReportableDIDRotateError):
     """Raised when keys cannot be recorded for a resolvable DID."""
 
 
+class DIDRotateLimiter:
+    """Bound the number of DID rotates processed concurrently.
+
+    A single instance is bound in the root context, so the bound is shared by
+    all profiles of the process, including tenant subwallets.
+    """
+
+    DEFAULT_MAX_IN_FLIGHT = 16
+
+    def __init__(self, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT):
+        """Initialize the DIDRotateLimiter."""
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def __aenter__(self):
+        """Wait for a free slot."""
+        await self._semaphore.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Release the slot."""
+        self._semaphore.release()
+
+
+class DIDRotateClaims:
+    """Track received rotates that are being processed.
+
+    Keys are (connection_id, thread_id) pairs. A rotate is claimed until its
+    record is saved, so a duplicate arriving in the meantime can be dropped.
+    """
+
+    def __init__(self):
+        """Initialize the DIDRotateClaims."""
+        self._claimed: Set[Tuple[str, str]] = set()
+
+    def claim(self, key: Tuple[str, str]) -> bool:
+        """Claim a key; False if it is already claimed."""
+        if key in self._claimed:
+            return False
+        self._claimed.add(key)
+        return True
+
+    def release(self, key: Tuple[str, str]):
+        """Release a claimed key."""
+        self._claimed.discard(key)
+
+
 class DIDRotateManager:
     """DID Rotate Manager.
 
@@ -69,6 +119,28 @@ class DIDRotateManager:
     def __init__(self, profile: Profile):
         """Initialize DID Rotate Manager."""
         self.profile = profile
+        # DID documents resolved while receiving a rotate, reused on commit
+        self._resolved_docs: Dict[str, dict] = {}
+
+    @cached_property
+    def _conn_mgr(self) -> BaseConnectionManager:
+        """Connection manager, created on first use and reused afterwards."""
+        return BaseConnectionManager(self.profile)
+
+    @cached_property
+    def _rotate_limiter(self) -> DIDRotateLimiter:
+        """Limiter shared by all DID rotate managers, bound at startup."""
+        return self.profile.inject(DIDRotateLimiter)
+
+    @cached_property
+    def _rotate_claims(self) -> DIDRotateClaims:
+        """Received rotates in progress, shared by all DID rotate managers."""
+        return self.profile.inject(DIDRotateClaims)
+
+    @cached_property
+    def _responder(self) -> BaseResponder:
+        """Responder, injected on first use and reused afterwards."""
+        return self.profile.inject(BaseResponder)
 
     async def hangup(self, conn: ConnRecord) -> Hangup:
         """Hangup the connection.
@@ -82,8 +154,7 @@ class DIDRotateManager:
         async with self.profile.session() as session:
             await conn.delete_record(session)
 
-        responder = self.profile.inject(BaseResponder)
-        await responder.send(hangup, connection_id=conn.connection_id)
+        await self._responder.send(hangup, connection_id=conn.connection_id)
 
         return hangup
 
@@ -104,38 +175,86 @@ class DIDRotateManager:
         rotate = Rotate(to_did=new_did)
         record.thread_id = rotate._message_id
 
-        responder = self.profile.inject(BaseResponder)
-        await responder.send(rotate, connection_id=conn.connection_id)
-
+        # Save before sending so the record exists when the ack comes back
         async with self.profile.session() as session:
             await record.save(session, reason="Sent rotate message")
 
+        try:
+            await self._responder.send(rotate, connection_id=conn.connection_id)
+        except Exception:
+            # Don't leave a record behind for a rotate that was never sent
+            async with self.profile.session() as session:
+                await record.delete_record(session)
+            raise
+
         return rotate
 
-    async def receive_rotate(self, conn: ConnRecord, rotate: Rotate) -> RotateRecord:
+    async def receive_rotate(
+        self, conn: ConnRecord, rotate: Rotate
+    ) -> Optional[RotateRecord]:
         """Receive rotate message.
 
         Args:
             conn (ConnRecord): The connection to rotate the DID for.
             rotate (Rotate): The received rotate message.
-        """
-        record = RotateRecord(
-            role=RotateRecord.ROLE_OBSERVING,
-            state=RotateRecord.STATE_ROTATE_RECEIVED,
-            connection_id=conn.connection_id,
-            new_did=rotate.to_did,
-            thread_id=rotate._message_id,
-        )
 
+        Returns:
+            The saved rotate record to commit, or None if there is nothing to
+            commit: the rotate is already being processed or was acked, or the
+            new DID is not supported.
+        """
+        # Claim the rotate until its record is saved so a duplicate arriving
+        # in the meantime is not processed as well
+        key = (conn.connection_id, rotate._message_id)
+        if not self._rotate_claims.claim(key):
+            return None
         try:
-            await self._ensure_supported_did(rotate.to_did)
-        except ReportableDIDRotateError as err:
-            responder = self.profile.inject(BaseResponder)
-            err.message.assign_thread_from(rotate)
-            await responder.send(err.message, connection_id=conn.connection_id)
-
-        async with self.profile.session() as session:
-            await record.save(session, reason="Received rotate message")
+            async with self.profile.session() as session:
+                records = await RotateRecord.query(
+                    session,
+                    {
+                        "connection_id": key[0],
+                        "thread_id": key[1],
+                        "role": RotateRecord.ROLE_OBSERVING,
+                    },
+                )
+            record = records[0] if records else None
+
+            if record and record.state == RotateRecord.STATE_ACK_SENT:
+                # The rotating party did not get our ack; send it again
+                await self._send_ack(conn, record)
+                return None
+            if record and record.state == RotateRecord.STATE_ROTATE_RECEIVED:
+                # An earlier attempt stopped before committing; commit it now
+                return record
+
+            async with self._rotate_limiter:
+                try:
+                    await self._ensure_supported_did(rotate.to_did)
+                except ReportableDIDRotateError as err:
+                    # Nothing is persisted for a rotate we cannot act on
+                    err.message.assign_thread_from(rotate)
+                    await self._responder.send(
+                        err.message, connection_id=conn.connection_id
+                    )
+                    return None
+
+                if record:
+                    # Retry of a rotate that failed to commit
+                    record.state = RotateRecord.STATE_ROTATE_RECEIVED
+                    record.error = None
+                else:
+                    record = RotateRecord(
+                        role=RotateRecord.ROLE_OBSERVING,
+                        state=RotateRecord.STATE_ROTATE_RECEIVED,
+                        connection_id=conn.connection_id,
+                        new_did=rotate.to_did,
+                        thread_id=rotate._message_id,
+                    )
+                async with self.profile.session() as session:
+                    await record.save(session, reason="Received rotate message")
+        finally:
+            self._rotate_claims.release(key)
 
         return record
 
@@ -150,32 +269,35 @@ class DIDRotateManager:
         if not record.new_did:
             raise ValueError("No new DID stored in record")
 
-        conn_mgr = BaseConnectionManager(self.profile)
-        try:
-            await conn_mgr.record_keys_for_resolvable_did(record.new_did)
-        except BaseConnectionManagerError:
-            raise UnrecordableKeysError(
-                RotateProblemReport.unrecordable_keys(record.new_did)
-            )
-
-        conn.their_did = record.new_did
-
-        ack = RotateAck()
-        ack.assign_thread_id(thid=record.thread_id)
-
-        responder = self.profile.inject(BaseResponder)
-        await responder.send(ack, connection_id=conn.connection_id)
-
-        async with self.profile.session() as session:
-            # Don't emit a connection event for this change
-            # Controllers should listen for the rotate event instead
-            await conn.save(session, reason="Their DID rotated", event=False)
-            await record.save(session, reason="Sent rotate ack")
-
-        # TODO it would be better if the cache key included DIDs so we don't
-        # have to manually clear it. This is a bigger change than a first pass
-        # warrants though.
-        await conn_mgr.clear_connection_targets_cache(conn.connection_id)
+        async with self._rotate_limiter:
+            try:
+                await self._conn_mgr.record_keys_for_resolvable_did(
+                    record.new_did,
+                    document=self._resolved_docs.get(record.new_did),
+                )
+            except BaseConnectionManagerError:
+                problem_report = RotateProblemReport.unrecordable_keys(record.new_did)
+                # Mark the record failed so a retried rotate is processed again
+                record.state = RotateRecord.STATE_FAILED
+                record.error = problem_report.description["code"]
+                async with self.profile.session() as session:
+                    await record.save(session, reason="Failed to record keys")
+                raise UnrecordableKeysError(problem_report)
+
+            conn.their_did = record.new_did
+
+            await self._send_ack(conn, record)
+
+            async with self.profile.session() as session:
+                # Don't emit a connection event for this change
+                # Controllers should listen for the rotate event instead
+                await conn.save(session, reason="Their DID rotated", event=False)
+                await record.save(session, reason="Sent rotate ack")
+
+            # TODO it would be better if the cache key included DIDs so we don't
+            # have to manually clear it. This is a bigger change than a first pass
+            # warrants though.
+            await self._conn_mgr.clear_connection_targets_cache(conn.connection_id)
 
     async def receive_ack(self, conn: ConnRecord, ack: RotateAck):
         """Receive rotate ack message.
@@ -187,12 +309,11 @@ class DIDRotateManager:
         async with self.profile.session() as session:
             record = await RotateRecord.retrieve_by_thread_id(session, ack._thread_id)
 
-        record.state = RotateRecord.STATE_ACK_RECEIVED
-        if not record.new_did:
-            raise ValueError("No new DID stored in record")
+            record.state = RotateRecord.STATE_ACK_RECEIVED
+            if not record.new_did:
+                raise ValueError("No new DID stored in record")
 
-        conn.my_did = record.new_did
-        async with self.profile.session() as session:
+            conn.my_did = record.new_did
             # Don't emit a connection event for this change
             # Controllers should listen for the rotate event instead
             await conn.save(session, reason="My DID rotated", event=False)
@@ -202,8 +323,7 @@ class DIDRotateManager:
         # TODO it would be better if the cache key included DIDs so we don't
         # have to manually clear it. This is a bigger change than a first pass
         # warrants though.
-        conn_mgr = BaseConnectionManager(self.profile)
-        await conn_mgr.clear_connection_targets_cache(conn.connection_id)
+        await self._conn_mgr.clear_connection_targets_cache(conn.connection_id)
 
     async def receive_problem_report(self, problem_report: RotateProblemReport):
         """Receive problem report message.
@@ -217,11 +337,10 @@ class DIDRotateManager:
                 session, problem_report._thread_id
             )
 
-        record.state = RotateRecord.STATE_FAILED
-        # Base ProblemReportSchema requires this value be present
-        assert problem_report.description
-        record.error = problem_report.description["code"]
-        async with self.profile.session() as session:
+            record.state = RotateRecord.STATE_FAILED
+            # Base ProblemReportSchema requires this value be present
+            assert problem_report.description
+            record.error = problem_report.description["code"]
             await record.save(session, reason="Received problem report")
 
     async def receive_hangup(self, conn: ConnRecord):
@@ -234,20 +353,28 @@ class DIDRotateManager:
         async with self.profile.session() as session:
             await conn.delete_record(session)
 
+    async def _send_ack(self, conn: ConnRecord, record: RotateRecord):
+        """Send a rotate ack for the record's thread."""
+        ack = RotateAck()
+        ack.assign_thread_id(thid=record.thread_id)
+
+        await self._responder.send(ack, connection_id=conn.connection_id)
+
     async def _ensure_supported_did(self, did: str):
         """Check if the DID is supported."""
-        resolver = self.profile.inject(DIDResolver)
-        conn_mgr = BaseConnectionManager(self.profile)
         try:
-            await resolver.resolve(self.profile, did)
+            resolver = self.profile.inject(DIDResolver)
+            doc = await resolver.resolve(self.profile, did)
         except DIDMethodNotSupported:
             raise UnsupportedDIDMethodError(RotateProblemReport.unsupported_method(did))
         except DIDNotFound:
             raise UnresolvableDIDError(RotateProblemReport.unresolvable(did))
 
         try:
-            await conn_mgr.resolve_didcomm_services(did)
+            await self._conn_mgr.resolve_didcomm_services(did, document=doc)
         except BaseConnectionManagerError:
             raise UnresolvableDIDCommServicesError(
                 RotateProblemReport.unresolvable_services(did)
             )
+
+        self._resolved_docs[did] = doc
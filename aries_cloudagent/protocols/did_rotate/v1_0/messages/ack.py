@@ -35,6 +35,7 @@ class RotateAckSchema(V10AckSchema):
     @pre_dump
     def check_thread_deco(self, obj, **kwargs):
         """Thread decorator, and its thid, are mandatory."""
-        if not obj._decorators.to_dict().get("~thread", {}).keys() >= {"thid"}:
+        thread = obj._thread
+        if not thread or thread.thid is None:
             raise ValidationError("Missing required field(s) in thread decorator")
         return obj
@@ -22,6 +22,14 @@ class ProblemReportReason(Enum):
     UNRECORDABLE_KEYS = "e.did.unrecordable_keys"
 
 
+_DESCRIPTIONS = {
+    ProblemReportReason.UNRESOLVABLE: "Unable to resolve DID",
+    ProblemReportReason.UNSUPPORTED_METHOD: "Unsupported DID Method",
+    ProblemReportReason.UNRESOLVABLE_SERVICES: "Unable to resolve DIDComm Services",
+    ProblemReportReason.UNRECORDABLE_KEYS: "Unable to record Keys ro Resolvable DID",
+}
+
+
 class RotateProblemReport(ProblemReport):
     """Base class representing a Rotate problem report message."""
 
@@ -44,15 +52,9 @@ class RotateProblemReport(ProblemReport):
         Returns:
             An instance of RotateProblemReport
         """
-        description = {
-            ProblemReportReason.UNRESOLVABLE: "Unable to resolve DID",
-            ProblemReportReason.UNSUPPORTED_METHOD: "Unsupported DID Method",
-            ProblemReportReason.UNRESOLVABLE_SERVICES: "Unable to resolve DIDComm Services",  # noqa: E501
-            ProblemReportReason.UNRECORDABLE_KEYS: "Unable to record Keys ro Resolvable DID",  # noqa: E501
-        }[problem_code]
         return cls(
             description={
-                "en": description,
+                "en": _DESCRIPTIONS[problem_code],
                 "code": problem_code.value,
             },
             problem_items=[
@@ -144,6 +146,7 @@ class RotateProblemReportSchema(ProblemReportSchema):
     @pre_dump
     def check_thread_deco(self, obj, **kwargs):
         """Thread decorator, and its thid, are mandatory."""
-        if not obj._decorators.to_dict().get("~thread", {}).keys() >= {"thid"}:
+        thread = obj._thread
+        if not thread or thread.thid is None:
             raise ValidationError("Missing required field(s) in thread decorator")
         return obj
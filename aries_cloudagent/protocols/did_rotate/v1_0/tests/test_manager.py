@@ -1,3 +1,4 @@
+import asyncio
 from unittest import IsolatedAsyncioTestCase
 
 from .....connections.base_manager import BaseConnectionManager
@@ -5,6 +6,8 @@ from .....core.in_memory.profile import InMemoryProfile
 from .....messaging.responder import BaseResponder, MockResponder
 from .....protocols.coordinate_mediation.v1_0.route_manager import RouteManager
 from .....protocols.did_rotate.v1_0.manager import (
+    DIDRotateClaims,
+    DIDRotateLimiter,
     DIDRotateManager,
     ReportableDIDRotateError,
     UnrecordableKeysError,
@@ -40,12 +43,71 @@ class TestDIDRotateManager(IsolatedAsyncioTestCase):
                 BaseResponder: self.responder,
                 RouteManager: self.route_manager,
                 DIDResolver: DIDResolver(),
+                DIDRotateLimiter: DIDRotateLimiter(),
+                DIDRotateClaims: DIDRotateClaims(),
             }
         )
 
         self.manager = DIDRotateManager(self.profile)
         assert self.manager.profile
 
+    def make_observing_record(self, new_did: str) -> RotateRecord:
+        return RotateRecord(
+            role=RotateRecord.ROLE_OBSERVING,
+            state=RotateRecord.STATE_ROTATE_RECEIVED,
+            connection_id=test_conn_id,
+            new_did=new_did,
+            thread_id="test-thread-id",
+        )
+
+    async def test_receive_rotate_waits_for_limiter(self):
+        limiter = DIDRotateLimiter(1)
+        self.profile.context.injector.bind_instance(DIDRotateLimiter, limiter)
+        manager = DIDRotateManager(self.profile)
+        mock_conn_record = MockConnRecord(test_conn_id, True)
+
+        with mock.patch.object(
+            manager, "_ensure_supported_did", mock.CoroutineMock()
+        ) as mock_ensure:
+            async with limiter:
+                task = asyncio.ensure_future(
+                    manager.receive_rotate(
+                        mock_conn_record, Rotate(to_did="did:peer:2:testdid")
+                    )
+                )
+                for _ in range(5):
+                    await asyncio.sleep(0)
+                assert not task.done()
+                mock_ensure.assert_not_called()
+
+            assert await task
+            mock_ensure.assert_called_once()
+
+    async def test_commit_rotate_waits_for_limiter(self):
+        limiter = DIDRotateLimiter(1)
+        self.profile.context.injector.bind_instance(DIDRotateLimiter, limiter)
+        manager = DIDRotateManager(self.profile)
+        mock_conn_record = MockConnRecord(test_conn_id, True)
+        mock_conn_record.save = mock.CoroutineMock()
+        record = self.make_observing_record("did:peer:2:testdid")
+
+        with mock.patch.object(
+            BaseConnectionManager, "record_keys_for_resolvable_did", mock.CoroutineMock()
+        ) as mock_record_keys, mock.patch.object(
+            BaseConnectionManager, "clear_connection_targets_cache", mock.CoroutineMock()
+        ):
+            async with limiter:
+                task = asyncio.ensure_future(
+                    manager.commit_rotate(mock_conn_record, record)
+                )
+                for _ in range(5):
+                    await asyncio.sleep(0)
+                assert not task.done()
+                mock_record_keys.assert_not_called()
+
+            await task
+            mock_record_keys.assert_called_once()
+
     async def test_hangup(self):
         mock_conn_record = MockConnRecord(test_conn_id, True)
         mock_conn_record.delete_record = mock.CoroutineMock()
@@ -72,7 +134,24 @@ class TestDIDRotateManager(IsolatedAsyncioTestCase):
             mock_send.assert_called_once()
             assert msg._type == DIDCommPrefix.NEW.value + "/" + test_message_types.ROTATE
 
-    async def test_receive_rotate(self):
+        async with self.profile.session() as session:
+            record = await RotateRecord.retrieve_by_thread_id(session, msg._message_id)
+        assert record.state == RotateRecord.STATE_ROTATE_SENT
+
+    async def test_rotate_my_did_x_send(self):
+        mock_conn_record = MockConnRecord(test_conn_id, True)
+
+        with mock.patch.object(
+            self.responder, "send", mock.CoroutineMock(side_effect=RuntimeError())
+        ):
+            with self.assertRaises(RuntimeError):
+                await self.manager.rotate_my_did(mock_conn_record, "did:peer:2:testdid")
+
+        async with self.profile.session() as session:
+            assert not await RotateRecord.query(session)
+
+    @mock.patch.object(DIDRotateManager, "_ensure_supported_did", mock.CoroutineMock())
+    async def test_receive_rotate(self, *_):
         mock_conn_record = MockConnRecord(test_conn_id, True)
 
         test_to_did = "did:peer:2:testdid"
@@ -86,6 +165,82 @@ class TestDIDRotateManager(IsolatedAsyncioTestCase):
         assert record.state == record.STATE_ROTATE_RECEIVED
         assert record.connection_id == mock_conn_record.connection_id
 
+    @mock.patch.object(DIDRotateManager, "_ensure_supported_did", mock.CoroutineMock())
+    async def test_receive_rotate_duplicate(self, *_):
+        mock_conn_record = MockConnRecord(test_conn_id, True)
+        rotate = Rotate(to_did="did:peer:2:testdid")
+
+        record = await self.manager.receive_rotate(mock_conn_record, rotate)
+        # Not committed yet, so the retry is handed back for commit
+        retried = await self.manager.receive_rotate(mock_conn_record, rotate)
+        assert retried.record_id == record.record_id
+        self.manager._ensure_supported_did.assert_called_once()
+
+    @mock.patch.object(DIDRotateManager, "_ensure_supported_did", mock.CoroutineMock())
+    async def test_receive_rotate_retry_after_ack_sent(self, *_):
+        mock_conn_record = MockConnRecord(test_conn_id, True)
+        record = self.make_observing_record("did:peer:2:testdid")
+        record.state = RotateRecord.STATE_ACK_SENT
+        async with self.profile.session() as session:
+            await record.save(session)
+
+        with mock.patch.object(self.responder, "send", mock.CoroutineMock()) as mock_send:
+            assert (
+                await self.manager.receive_rotate(
+                    mock_conn_record,
+                    Rotate(to_did=record.new_did, _id=record.thread_id),
+                )
+                is None
+            )
+            mock_send.assert_called_once()
+            ack = mock_send.call_args.args[0]
+            assert isinstance(ack, RotateAck)
+            assert ack._thread_id == record.thread_id
+
+        self.manager._ensure_supported_did.assert_not_called()
+
+    @mock.patch.object(DIDRotateManager, "_ensure_supported_did", mock.CoroutineMock())
+    async def test_receive_rotate_retry_after_failed(self, *_):
+        mock_conn_record = MockConnRecord(test_conn_id, True)
+        record = self.make_observing_record("did:peer:2:testdid")
+        record.state = RotateRecord.STATE_FAILED
+        record.error = "e.did.unrecordable_keys"
+        async with self.profile.session() as session:
+            await record.save(session)
+
+        retried = await self.manager.receive_rotate(
+            mock_conn_record, Rotate(to_did=record.new_did, _id=record.thread_id)
+        )
+        assert retried.record_id == record.record_id
+        assert retried.state == RotateRecord.STATE_ROTATE_RECEIVED
+        assert retried.error is None
+        self.manager._ensure_supported_did.assert_called_once()
+
+        async with self.profile.session() as session:
+            assert len(await RotateRecord.query(session)) == 1
+
+    async def test_receive_rotate_concurrent_duplicate(self):
+        mock_conn_record = MockConnRecord(test_conn_id, True)
+        rotate = Rotate(to_did="did:peer:2:testdid")
+
+        async def _ensure_supported_did(did):
+            await asyncio.sleep(0)
+
+        with mock.patch.object(
+            DIDRotateManager,
+            "_ensure_supported_did",
+            mock.CoroutineMock(side_effect=_ensure_supported_did),
+        ) as mock_ensure:
+            results = await asyncio.gather(
+                self.manager.receive_rotate(mock_conn_record, rotate),
+                DIDRotateManager(self.profile).receive_rotate(mock_conn_record, rotate),
+            )
+            mock_ensure.assert_called_once()
+
+        assert len([result for result in results if result]) == 1
+        async with self.profile.session() as session:
+            assert len(await RotateRecord.query(session)) == 1
+
     async def test_receive_rotate_x(self):
         mock_conn_record = MockConnRecord(test_conn_id, True)
 
@@ -97,13 +252,17 @@ class TestDIDRotateManager(IsolatedAsyncioTestCase):
         with mock.patch.object(
             self.manager, "_ensure_supported_did", side_effect=test_problem_report
         ), mock.patch.object(self.responder, "send", mock.CoroutineMock()) as mock_send:
-            await self.manager.receive_rotate(
+            record = await self.manager.receive_rotate(
                 mock_conn_record, Rotate(to_did=test_to_did)
             )
             mock_send.assert_called_once_with(
                 test_problem_report.message,
                 connection_id=mock_conn_record.connection_id,
             )
+            assert record is None
+
+        async with self.profile.session() as session:
+            assert not await RotateRecord.query(session)
 
     @mock.patch.object(
         BaseConnectionManager,
@@ -116,9 +275,7 @@ class TestDIDRotateManager(IsolatedAsyncioTestCase):
 
         test_to_did = "did:peer:2:testdid"
 
-        record = await self.manager.receive_rotate(
-            mock_conn_record, Rotate(to_did=test_to_did)
-        )
+        record = self.make_observing_record(test_to_did)
         await self.manager.commit_rotate(mock_conn_record, record)
 
         assert record.state == RotateRecord.STATE_ACK_SENT
@@ -134,27 +291,52 @@ class TestDIDRotateManager(IsolatedAsyncioTestCase):
 
         test_to_did = "did:peer:2:testdid"
 
-        record = await self.manager.receive_rotate(
-            mock_conn_record, Rotate(to_did=test_to_did)
-        )
+        record = self.make_observing_record(test_to_did)
         record.new_did = None
 
         with self.assertRaises(ValueError):
             await self.manager.commit_rotate(mock_conn_record, record)
 
+    async def test_commit_rotate_reuses_resolved_did_doc(self):
+        mock_conn_record = MockConnRecord(test_conn_id, True)
+        mock_conn_record.save = mock.CoroutineMock()
+
+        test_to_did = "did:peer:2:testdid"
+        test_doc = {"id": test_to_did}
+
+        with mock.patch.object(
+            self.profile.inject(DIDResolver),
+            "resolve",
+            mock.CoroutineMock(return_value=test_doc),
+        ) as mock_resolve, mock.patch.object(
+            BaseConnectionManager, "resolve_didcomm_services", mock.CoroutineMock()
+        ), mock.patch.object(
+            BaseConnectionManager, "record_keys_for_resolvable_did", mock.CoroutineMock()
+        ) as mock_record_keys:
+            record = await self.manager.receive_rotate(
+                mock_conn_record, Rotate(to_did=test_to_did)
+            )
+            await self.manager.commit_rotate(mock_conn_record, record)
+
+            mock_resolve.assert_called_once()
+            mock_record_keys.assert_called_once_with(test_to_did, document=test_doc)
+
     async def test_commit_rotate_x_unrecordable_keys(self):
         mock_conn_record = MockConnRecord(test_conn_id, True)
         mock_conn_record.save = mock.CoroutineMock()
 
         test_to_did = "did:peer:2:testdid"
 
-        record = await self.manager.receive_rotate(
-            mock_conn_record, Rotate(to_did=test_to_did)
-        )
+        record = self.make_observing_record(test_to_did)
 
         with self.assertRaises(UnrecordableKeysError):
             await self.manager.commit_rotate(mock_conn_record, record)
 
+        async with self.profile.session() as session:
+            stored = await RotateRecord.retrieve_by_id(session, record.record_id)
+        assert stored.state == RotateRecord.STATE_FAILED
+        assert stored.error
+
     @mock.patch.object(
         BaseConnectionManager,
         "clear_connection_targets_cache",
@@ -23,6 +23,9 @@ class ProblemReportReason(Enum):
     EXISTING_CONNECTION_NOT_ACTIVE = "existing_connection_not_active"
 
 
+_ALLOWED_CODES = frozenset(prr.value for prr in ProblemReportReason)
+
+
 class OOBProblemReport(ProblemReport):
     """Base class representing an OOB connection reuse problem report message."""
 
@@ -66,7 +69,8 @@ class OOBProblemReportSchema(ProblemReportSchema):
     def check_thread_deco(self, obj, **kwargs):
         """Thread decorator, and its thid and pthid, are mandatory."""
 
-        if not obj._decorators.to_dict().get("~thread", {}).keys() >= {"thid", "pthid"}:
+        thread = obj._thread
+        if not thread or thread.thid is None or thread.pthid is None:
             raise ValidationError("Missing required field(s) in thread decorator")
 
         return obj
@@ -75,15 +79,15 @@ class OOBProblemReportSchema(ProblemReportSchema):
     def validate_fields(self, data, **kwargs):
         """Validate schema fields."""
 
-        if not data.get("description", {}).get("code", ""):
+        description = data.get("description") or {}
+        code = description.get("code", "")
+        if not code:
             raise ValidationError("Value for description.code must be present")
-        elif data.get("description", {}).get("code", "") not in [
-            prr.value for prr in ProblemReportReason
-        ]:
-            locales = list(data.get("description").keys())
-            locales.remove("code")
-            LOGGER.warning(
-                "Unexpected error code received.\n"
-                f"Code: {data.get('description').get('code')}, "
-                f"Description: {data.get('description').get(locales[0])}"
-            )
+        elif code not in _ALLOWED_CODES:
+            if LOGGER.isEnabledFor(logging.WARNING):
+                locales = [k for k in description if k != "code"]
+                LOGGER.warning(
+                    "Unexpected error code received.\nCode: %s, Description: %s",
+                    code,
+                    description.get(locales[0]) if locales else "",
+                )
@@ -51,6 +51,7 @@ class HandshakeReuseSchema(AgentMessageSchema):
     @pre_dump
     def check_thread_deco(self, obj, **kwargs):
         """Thread decorator, and its thid and pthid, are mandatory."""
-        if not obj._decorators.to_dict().get("~thread", {}).keys() >= {"thid", "pthid"}:
+        thread = obj._thread
+        if not thread or thread.thid is None or thread.pthid is None:
             raise ValidationError("Missing required field(s) in thread decorator")
         return obj
@@ -50,11 +50,17 @@ class TestOOBProblemReportMessage(TestCase):
         with pytest.raises(BaseModelError):
             data = self.problem_report.serialize()
 
+        self.problem_report.assign_thread_id(thid="test_thid")
+        with pytest.raises(BaseModelError):
+            self.problem_report.serialize()
+
     def test_validate_x(self):
         """Exercise validation requirements."""
         schema = OOBProblemReportSchema()
         with pytest.raises(ValidationError):
             schema.validate_fields({})
+        with pytest.raises(ValidationError):
+            schema.validate_fields({"description": None})
 
     def test_validate_and_logger(self):
         """Capture ValidationError and Logs."""
@@ -70,6 +76,14 @@ class TestOOBProblemReportMessage(TestCase):
             OOBProblemReportSchema().validate_fields(data)
         assert mock_logger.warning.call_count == 1
 
+    def test_validate_and_logger_no_locale(self):
+        """Log an unexpected code without a localized description."""
+        with mock.patch.object(test_module, "LOGGER", autospec=True) as mock_logger:
+            OOBProblemReportSchema().validate_fields(
+                {"description": {"code": "invalid_code"}}
+            )
+        assert mock_logger.warning.call_count == 1
+
     def test_assign_msg_type_version_to_model_inst(self):
         test_msg = OOBProblemReport()
         assert "1.1" in test_msg._type